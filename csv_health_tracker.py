@@ -1,114 +1,171 @@
 
+import argparse
+import os
+import stat
+from collections import Counter
 from pathlib import Path
 
-print("=" * 80)
-print("CSV Health Tracker")
-print("A python tool that checks the status of the CSV file before heading down the data workflow.")
-print("Please provide the path to the 'CSV file'")
-print("Example: /User/Desktop/Documents/example.csv")
-print("=" * 80)
+SEPARATOR = "=" * 80
 
+# infer_dtype kinds that can contain str values (the ones the .str accessor accepts)
+STRING_KINDS = {"string", "mixed", "mixed-integer"}
 
-print("Please provide the file path to the specific CSV file")
-user_input = input().strip()
 
-while not user_input:
-    print("The input provided is empty. Please provide the file path.")
-    user_input = input("Enter file path: ").strip()
+def main(argv=None):
+    # Optional flag: --full prints describe(include='all') instead of the quick numeric summary.
+    # Unknown arguments (e.g. a typo like --ful) exit with a usage message
+    parser = argparse.ArgumentParser(
+        description="Checks the status of a CSV file before it heads down the data workflow.",
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "--full", action="store_true",
+        help="print describe() statistics for all columns instead of the numeric summary",
+    )
+    show_full_stats = parser.parse_args(argv).full
 
-file_path = Path(user_input)
+    print(SEPARATOR)
+    print("CSV Health Tracker")
+    print("A python tool that checks the status of the CSV file before heading down the data workflow.")
+    print("Please provide the path to the 'CSV file'")
+    print("Example: /User/Desktop/Documents/example.csv")
+    print(SEPARATOR)
 
 
+    print("Please provide the file path to the specific CSV file")
+    user_input = input().strip()
 
+    while not user_input:
+        print("The input provided is empty. Please provide the file path.")
+        user_input = input("Enter file path: ").strip()
 
-# Check 1: Does the file path exist?
-if not file_path.exists():
-    print(f"Error: '{file_path}' does not exist")
-    exit()
+    file_path = Path(user_input)
 
-# Check 2: Is it a file?
-if not file_path.is_file():
-    print(f"Error: '{file_path}' is a directory, not a file")
-    exit()
+    # Check 1: Does the file path exist?
+    # A single stat() call serves both the existence and the file-type check
+    # (ValueError covers paths with an embedded null byte, which Path.exists() treated as missing)
+    try:
+        file_stat = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        print(f"Error: '{file_path}' does not exist")
+        return
+    except OSError as error:
+        print(f"Error: cannot access '{file_path}': {error.strerror}")
+        return
 
-# Check 3: Is it a csv?
-if file_path.suffix.lower() != '.csv':
-    print(f"Error: '{file_path}' is not a CSV file.")
-    exit()
+    # Check 2: Is it a file?
+    if not stat.S_ISREG(file_stat.st_mode):
+        print(f"Error: '{file_path}' is a directory, not a file")
+        return
 
+    # Check 3: Is it a csv?
+    if file_path.suffix.lower() != '.csv':
+        print(f"Error: '{file_path}' is not a CSV file.")
+        return
 
-print(" File is valid. Beginning analysis")
 
-# getting the filename
-user_file = file_path.name
+    print(" File is valid. Beginning analysis")
 
-import pandas as pd
+    # getting the filename
+    user_file = file_path.name
 
-# reading the file with pandas
-df = pd.read_csv(file_path)
+    # Imported only after the path checks pass, so invalid paths never pay for the pandas import
+    import pandas as pd
 
-print("=" * 80)
-print(f"DIAGNOSIS REPORT OF {user_file}:")
-print("=" * 80)
+    # reading the file with pandas
+    df = pd.read_csv(file_path)
 
+    print(SEPARATOR)
+    print(f"DIAGNOSIS REPORT OF {user_file}:")
+    print(SEPARATOR)
 
-print(f"Number of Rows and Columns: {df.shape}")
 
-print("\nColumn Names:")
-column_names = df.columns.tolist()
+    print(f"Number of Rows and Columns: {df.shape}")
 
-# Check if pandas assigned default numeric column names (0, 1,2 ...)
-# This happens when CSV has no header row
-has_default_names = all(isinstance(col, int) for col in df.columns)
+    print("\nColumn Names:")
+    column_names = df.columns.tolist()
 
-if has_default_names:
-    print("WARNNING: No column headers detected (using default names: 0, 1,2,....)")
-    print((f"Columns: {column_names}"))
-else: print(f"Columns: {column_names}")
+    # Check if pandas assigned default numeric column names (0, 1,2 ...)
+    # This happens when CSV has no header row
+    has_default_names = all(isinstance(col, int) for col in df.columns)
 
-# Check for duplicate column names
-duplicate_columns = df.columns[df.columns.duplicated()].tolist()
+    if has_default_names:
+        print("WARNNING: No column headers detected (using default names: 0, 1,2,....)")
+        print((f"Columns: {column_names}"))
+    else: print(f"Columns: {column_names}")
 
-if duplicate_columns:
-    print(f"WARNING: Duplicate column names detected: {duplicate_columns}")
+    # Check for duplicate column names (name -> number of occurrences)
+    column_counts = Counter(df.columns)
+    duplicate_columns = {col: count for col, count in column_counts.items() if count > 1}
 
-# Number of duplicated rows
-num_duplicated_rows = df.duplicated().sum() # Total count
+    if duplicate_columns:
+        print(f"WARNING: Duplicate column names detected: {duplicate_columns}")
 
-print(f"Number of duplicated rows: {num_duplicated_rows}")
+    # Number of duplicated rows
+    num_duplicated_rows = df.duplicated().sum() # Total count
 
-# The data type of the columns as inferred by pandas
-print(f"Data types:\n{df.dtypes}")
+    print(f"Number of duplicated rows: {num_duplicated_rows}")
 
-# Empty columns
-empty_cols = df.columns[df.isna().all()].tolist()
+    # The data type of the columns as inferred by pandas
+    print(f"Data types:\n{df.dtypes}")
 
-if empty_cols:
-    print(f"WARNNING: Empty columns detected: {empty_cols} ")
+    # Missing-value mask, computed once and shared by the empty column/row checks
+    missing_mask = df.isna()
 
-# Empty rows
-empty_rows = df[df.isna().all(axis=1)]
-num_empty_rows = len(empty_rows)
+    # Empty columns
+    empty_cols = df.columns[missing_mask.all()].tolist()
 
-print(f"Number of completely empty rows: {num_empty_rows}")
+    if empty_cols:
+        print(f"WARNNING: Empty columns detected: {empty_cols} ")
 
-# Showing the basic statistics of all the columns; numeric as well as non-numeric
-print("Basic Statistics: ")
-print(df.describe(include='all'))
+    # Empty rows
+    num_empty_rows = missing_mask.all(axis=1).sum()
 
-# Whitespace pollution (flag if beyond threshold)
+    print(f"Number of completely empty rows: {num_empty_rows}")
 
-# Check each string column for whitespace pollution
+    # Showing the basic statistics
+    # describe(include='all') sorts every numeric column for its quartiles, so it only runs with --full
+    if show_full_stats:
+        print("Basic Statistics: ")
+        print(df.describe(include='all'))
+    else:
+        numeric_df = df.select_dtypes(include='number')
+        print("Basic Statistics (numeric columns; use --full for all columns): ")
+        if numeric_df.columns.empty:
+            print("No numeric columns found")
+        else:
+            print(numeric_df.agg(['count', 'mean', 'std', 'min', 'max']))
 
-threshold = 10 # 10% threshold
+    # Whitespace pollution (flag if beyond threshold)
 
-for col in df.select_dtypes(include='object').columns:
-    has_whitespace = df[col].apply(lambda x: isinstance(x, str) and x != x.strip())
-    whitespace_count = has_whitespace.sum()
-    whitespace_pct = (whitespace_count / len(df)) * 100
+    # Check each string column for whitespace pollution
 
-    if whitespace_pct > threshold: 
-        print(f" Column '{col}': {whitespace_pct:.1f}% of values have whitespace")
+    threshold = 10 # 10% threshold
+    num_rows = len(df)
+
+    # Text columns may be object or a dedicated string dtype ('str' is the default from pandas 3).
+    # is_string_dtype is True for any object column, so the values are checked too: object columns
+    # holding only non-strings (e.g. booleans with a blank cell) are rejected by the .str accessor
+    text_columns = [
+        col for col, dtype in df.dtypes.items()
+        if pd.api.types.is_string_dtype(dtype)
+        and pd.api.types.infer_dtype(df[col], skipna=True) in STRING_KINDS
+    ]
+
+    for col in text_columns:
+        values = df[col]
+        # Vectorized strip; non-string cells come back as NaN and are not counted
+        stripped = values.str.strip()
+        has_whitespace = stripped.notna() & (stripped != values)
+        whitespace_count = has_whitespace.sum()
+        whitespace_pct = (whitespace_count / num_rows) * 100
+
+        if whitespace_pct > threshold: 
+            print(f" Column '{col}': {whitespace_pct:.1f}% of values have whitespace")
+
+
+if __name__ == "__main__":
+    main()
 
 
 
@@ -133,7 +190,7 @@ AREAS FOR IMPROVEMENT
 
 7. ❌ Missing exception handling: No try/except around pd.read_csv()
 
-8. ⚠️ No if __name__ == "__main__": block: Not critical for a script, but good practice
+8. ✅ Resolved: the script now runs from main() behind an if __name__ == "__main__": block
 
 9. ⚠️ Data types output is raw pandas: df.dtypes prints as a Series, which can be hard to read for large files
    ⚠️ df.describe() can be overwhelming: For files with 50+ columns, this becomes unreadable